@@ -18,6 +18,12 @@ from .const import (
     DOMAIN,
     PLATFORMS,
 )
+from .values import (
+    BINARY_SENSOR_VALUE_FNS,
+    SENSOR_VALUE_FNS,
+    compute_values,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -35,9 +41,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def _async_update_data():
         try:
-            return await client.async_get_data()
+            data = await client.async_get_data()
         except FelicityApiError as err:
             raise UpdateFailed(str(err)) from err
+        # Все значения сенсоров считаем один раз за опрос
+        data["_cached"] = compute_values(data, SENSOR_VALUE_FNS)
+        data["_cached_binary"] = compute_values(data, BINARY_SENSOR_VALUE_FNS)
+        return data
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -47,7 +57,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # HA повторит setup с новым клиентом - не оставляем открытый сокет
+        await client.async_close()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -63,5 +78,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok and DOMAIN in hass.data:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data:
+            await entry_data["client"].async_close()
     return unload_ok
@@ -8,6 +8,20 @@ from typing import Any, Dict
 
 _LOGGER = logging.getLogger(__name__)
 
+# Whole-response budget and grace period for trailing data, seconds
+_READ_TIMEOUT = 3.0
+_TAIL_TIMEOUT = 0.2
+_TAIL_LIMIT = 1024
+
+# Device answers with single-quoted pseudo-JSON
+_QUOTE_TRANS = bytes.maketrans(b"'", b'"')
+
+# Some firmwares drop the "BTemp" key: "Bfault":0[[...]] -> "Bfault":0,"BTemp":[[...]]
+_RE_BTEMP_PATCH = re.compile(rb'"Bfault"\s*:\s*([-0-9]+)\s*\[\[')
+_RE_PY_NONE = re.compile(rb"\bNone\b")
+
+_JSON_DECODER = json.JSONDecoder()
+
 
 class FelicityApiError(Exception):
     """Error while communicating with Felicity battery."""
@@ -19,6 +33,9 @@ class FelicityClient:
     def __init__(self, host: str, port: int) -> None:
         self._host = host
         self._port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
 
     async def async_get_data(self) -> dict:
         """Send commands and combine all data into one dict.
@@ -27,6 +44,17 @@ class FelicityClient:
         - wifilocalMonitor:get dev basice infor -> versions / type
         - wifilocalMonitor:get dev set infor    -> config / limits (multi-json)
         """
+        async with self._lock:
+            try:
+                return await self._async_poll()
+            finally:
+                # Хвост ответа может прийти позже окна _TAIL_TIMEOUT и
+                # попасть в начало следующего опроса - соединение
+                # переиспользуется только внутри одного опроса
+                await self.async_close()
+
+    async def _async_poll(self) -> dict:
+        """Run all commands of one poll over a shared connection."""
         # 1. Runtime data
         real_raw = await self._async_read_raw(b"wifilocalMonitor:get dev real infor")
         real = self._parse_real_payload(real_raw)
@@ -37,8 +65,7 @@ class FelicityClient:
             basic_raw = await self._async_read_raw(
                 b"wifilocalMonitor:get dev basice infor"
             )
-            basic_text = basic_raw.replace("'", '"').strip()
-            basic = json.loads(basic_text)
+            basic = json.loads(basic_raw.translate(_QUOTE_TRANS).decode("latin-1"))
             data["_basic"] = basic
         except Exception as err:
             _LOGGER.debug("Failed to read basic info: %s", err)
@@ -49,20 +76,21 @@ class FelicityClient:
             set_raw = await self._async_read_raw(
                 b"wifilocalMonitor:get dev set infor"
             )
-            set_text = set_raw.replace("'", '"').strip()
+            set_text = set_raw.translate(_QUOTE_TRANS)
             merged: Dict[str, Any] = {}
 
             # Разбираем несколько JSON-объектов подряд:
             depth = 0
             start = None
-            json_objects: list[str] = []
+            json_objects: list[bytes] = []
+            open_brace, close_brace = ord("{"), ord("}")
 
             for i, ch in enumerate(set_text):
-                if ch == "{":
+                if ch == open_brace:
                     if depth == 0:
                         start = i
                     depth += 1
-                elif ch == "}":
+                elif ch == close_brace:
                     if depth > 0:
                         depth -= 1
                         if depth == 0 and start is not None:
@@ -71,11 +99,11 @@ class FelicityClient:
 
             # На всякий случай fallback на простое регулярное выражение
             if not json_objects:
-                json_objects = re.findall(r"\{.*?\}", set_text)
+                json_objects = re.findall(rb"\{.*?\}", set_text)
 
             for obj in json_objects:
                 try:
-                    part = json.loads(obj)
+                    part = json.loads(obj.decode("latin-1"))
                     merged.update(part)
                 except Exception as e:
                     _LOGGER.debug("Skip invalid part in settings: %s", e)
@@ -83,11 +111,12 @@ class FelicityClient:
 
             if merged:
                 data["_settings"] = merged
-                _LOGGER.debug(
-                    "Merged Felicity settings (%d keys): %s",
-                    len(merged),
-                    merged,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Merged Felicity settings (%d keys): %s",
+                        len(merged),
+                        merged,
+                    )
             else:
                 _LOGGER.debug("No valid JSON found in settings payload: %r", set_text)
 
@@ -96,176 +125,171 @@ class FelicityClient:
 
         return data
 
-    async def _async_read_raw(self, command: bytes) -> str:
-        """Open TCP, send command, read response as text."""
+    async def async_close(self) -> None:
+        """Close the shared TCP connection, if any."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    async def _async_connect(self) -> bool:
+        """Reuse the open connection or open a new one; True if reused."""
+        if self._writer is not None and self._reader is not None:
+            if not self._writer.is_closing() and not self._reader.at_eof():
+                return True
+            await self.async_close()
+
         try:
-            reader, writer = await asyncio.open_connection(self._host, self._port)
+            self._reader, self._writer = await asyncio.open_connection(
+                self._host, self._port
+            )
         except Exception as err:
             raise FelicityApiError(
                 f"Error connecting to {self._host}:{self._port}: {err}"
             ) from err
+        return False
 
-        try:
-            writer.write(command)
-            await writer.drain()
+    async def _async_read_raw(self, command: bytes) -> bytes:
+        """Send command over the shared TCP connection, read raw response."""
+        for _ in range(2):
+            reused = await self._async_connect()
+            try:
+                data = await self._async_exchange(command)
+                if not data and reused:
+                    raise ConnectionResetError("Connection closed by battery")
+            except ConnectionError as err:
+                await self.async_close()
+                if reused:
+                    # старое соединение оборвалось - переподключаемся один раз
+                    _LOGGER.debug(
+                        "Reconnecting to %s:%s: %s", self._host, self._port, err
+                    )
+                    continue
+                raise FelicityApiError(
+                    f"Error talking to {self._host}:{self._port}: {err}"
+                ) from err
+            except Exception as err:
+                await self.async_close()
+                raise FelicityApiError(
+                    f"Error talking to {self._host}:{self._port}: {err}"
+                ) from err
+            break
 
-            data = b""
-            for _ in range(20):
-                try:
-                    chunk = await asyncio.wait_for(reader.read(1024), timeout=0.5)
-                except asyncio.TimeoutError:
-                    break
-                if not chunk:
-                    break
-                data += chunk
-                if b"}" in chunk:
-                    try:
-                        more = await asyncio.wait_for(reader.read(1024), timeout=0.2)
-                        if more:
-                            data += more
-                    except asyncio.TimeoutError:
-                        pass
-                    break
+        if not data:
+            await self.async_close()
+            raise FelicityApiError("No data received from battery")
 
-        except Exception as err:
-            raise FelicityApiError(
-                f"Error talking to {self._host}:{self._port}: {err}"
-            ) from err
-        finally:
-            writer.close()
+        data = data.strip()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Raw Felicity response for %r: %r", command, data)
+        return data
+
+    async def _async_exchange(self, command: bytes) -> bytes:
+        """Write command to the open connection and read one response."""
+        assert self._reader is not None and self._writer is not None
+        reader = self._reader
+        await self._async_discard_pending(reader)
+        self._writer.write(command)
+        await self._writer.drain()
+
+        # после таймаута или многоблочного ответа в сокете может остаться
+        # недочитанный хвост - такое соединение не переиспользуем
+        keep_open = True
+        data = b""
+        try:
+            async with asyncio.timeout(_READ_TIMEOUT):
+                data = await reader.readuntil(b"}")
+        except asyncio.IncompleteReadError as err:
+            # соединение закрыто до '}' - берём то, что успели получить
+            data = err.partial
+        except TimeoutError:
+            keep_open = False
+
+        if b"}" in data:
+            # хвост ответа (например, второй JSON-блок в 'dev set infor')
             try:
-                await writer.wait_closed()
-            except Exception:
+                async with asyncio.timeout(_TAIL_TIMEOUT):
+                    more = await reader.read(_TAIL_LIMIT)
+                data += more
+                if more:
+                    keep_open = False
+            except TimeoutError:
                 pass
 
-        if not data:
-            raise FelicityApiError("No data received from battery")
+        if not keep_open:
+            await self.async_close()
+        return data
 
-        text = data.decode("ascii", errors="ignore").strip()
-        _LOGGER.debug("Raw Felicity response for %r: %r", command, text)
-        return text
+    async def _async_discard_pending(self, reader: asyncio.StreamReader) -> None:
+        """Drop bytes of a late reply still buffered on a reused connection."""
+        while True:
+            try:
+                async with asyncio.timeout(0):
+                    stale = await reader.read(4096)
+            except TimeoutError:
+                return
+            if not stale:
+                raise ConnectionResetError("Connection closed by battery")
+            _LOGGER.debug("Discarded %d stale bytes: %r", len(stale), stale)
 
     # --------------------------------------------------------------------- #
     #                         PARSER 'dev real infor'                       #
     # --------------------------------------------------------------------- #
 
-    def _parse_real_payload(self, text: str) -> Dict[str, Any]:
+    def _parse_real_payload(self, raw: bytes) -> Dict[str, Any]:
         """Parse Felicity 'dev real infor' payload into dict we use."""
-        norm = text.replace("'", '"')
-        last_brace = norm.rfind("}")
-        if last_brace != -1:
-            norm = norm[: last_brace + 1]
-
-        result: Dict[str, Any] = {}
-
-        def _find_str(key: str) -> str | None:
-            m = re.search(rf'"{key}"\s*:\s*"([^"]*)"', norm)
-            return m.group(1) if m else None
-
-        def _find_int(key: str) -> int | None:
-            m = re.search(rf'"{key}"\s*:\s*([-0-9]+)', norm)
-            return int(m.group(1)) if m else None
-
-        # Simple fields
-        result["CommVer"] = _find_int("CommVer")
-        result["wifiSN"] = _find_str("wifiSN")
-        result["DevSN"] = _find_str("DevSN")
-        result["Estate"] = _find_int("Estate")
-        result["Bfault"] = _find_int("Bfault")
-        result["Bwarn"] = _find_int("Bwarn") or 0
-
-        # Batt: [[53300],[1],[null]]
-        m = re.search(
-            r'"Batt"\s*:\s*\[\s*\[\s*([-0-9]+)\s*\]\s*,\s*\[\s*([-0-9]+)\s*\]\s*,\s*\[\s*(null|None|[-0-9]+)?\s*\]\s*\]',
-            norm,
-        )
-        if m:
-            v = int(m.group(1))
-            i = int(m.group(2))
-            third_raw = m.group(3)
-            third = None
-            if third_raw not in (None, "null", "None", ""):
-                third = int(third_raw)
-            result["Batt"] = [[v], [i], [third]]
-
-        # Batsoc: [[9900,1000,250000]]
-        m = re.search(
-            r'"Batsoc"\s*:\s*\[\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]\s*\]',
-            norm,
-        )
-        if m:
-            soc = int(m.group(1))
-            scale = int(m.group(2))
-            cap = int(m.group(3))
-            result["Batsoc"] = [[soc, scale, cap]]
-
-        # BMaxMin: [[3345,3338],[6,7]]
-        m = re.search(
-            r'"BMaxMin"\s*:\s*\[\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]\s*,\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]\s*\]',
-            norm,
-        )
-        if m:
-            max_v = int(m.group(1))
-            min_v = int(m.group(2))
-            max_i = int(m.group(3))
-            min_i = int(m.group(4))
-            result["BMaxMin"] = [[max_v, min_v], [max_i, min_i]]
-
-        # LVolCur: [[576,480],[100,1500]]
-        m = re.search(
-            r'"LVolCur"\s*:\s*\[\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]\s*,\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]\s*\]',
-            norm,
-        )
-        if m:
-            v1 = int(m.group(1))
-            v2 = int(m.group(2))
-            c1 = int(m.group(3))
-            c2 = int(m.group(4))
-            result["LVolCur"] = [[v1, v2], [c1, c2]]
-
-        # BTemp
-        btemp = None
-        m = re.search(
-            r'"BTemp"\s*:\s*\[\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]'
-            r'(?:\s*,\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\])?\s*\]',
-            norm,
-        )
-        if m:
-            t1 = int(m.group(1))
-            t2 = int(m.group(2))
-            if m.group(3) is not None and m.group(4) is not None:
-                t3 = int(m.group(3))
-                t4 = int(m.group(4))
-                btemp = [[t1, t2], [t3, t4]]
-            else:
-                btemp = [[t1, t2]]
-        else:
-            m = re.search(
-                r'"Templist"\s*:\s*\[\s*\[\s*([-0-9]+)\s*,\s*([-0-9]+)\s*\]',
-                norm,
-            )
-            if m:
-                t1 = int(m.group(1))
-                t2 = int(m.group(2))
-                btemp = [[t1, t2]]
-        if btemp is not None:
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        norm = raw.translate(_QUOTE_TRANS)
+        if b'"BTemp"' not in norm and b'"Bfault"' in norm:
+            norm, n = _RE_BTEMP_PATCH.subn(rb'"Bfault":\1,"BTemp":[[', norm)
+            if debug and n:
+                _LOGGER.debug("Patched BTemp after Bfault (replacements=%s)", n)
+        # Batt иногда приходит в питоновском виде: [[53300],[1],[ None ]]
+        norm = _RE_PY_NONE.sub(b"null", norm)
+
+        # Разбираем первый JSON-объект; мусор до и после него игнорируем
+        text = norm.decode("latin-1")
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, max(text.find("{"), 0))
+        except ValueError as err:
+            raise FelicityApiError(
+                f"Unable to parse payload ({err}): {raw!r}"
+            ) from err
+        if not isinstance(parsed, dict):
+            raise FelicityApiError(f"Unexpected payload: {raw!r}")
+
+        result: Dict[str, Any] = {
+            "CommVer": parsed.get("CommVer"),
+            "wifiSN": parsed.get("wifiSN"),
+            "DevSN": parsed.get("DevSN"),
+            "Estate": parsed.get("Estate"),
+            "Bfault": parsed.get("Bfault"),
+            "Bwarn": parsed.get("Bwarn") or 0,
+        }
+        for key in ("Batt", "Batsoc", "BMaxMin", "LVolCur", "BatcelList"):
+            if key in parsed:
+                result[key] = parsed[key]
+
+        btemp = parsed.get("BTemp")
+        if not btemp:
+            templist = parsed.get("Templist")
+            if isinstance(templist, list) and templist:
+                btemp = [templist[0]]
+        if btemp:
             result["BTemp"] = btemp
 
-        # BatcelList
-        m = re.search(r'"BatcelList"\s*:\s*\[\s*\[([0-9,\s-]+)\]', norm)
-        if m:
-            cells_str = m.group(1)
-            try:
-                cells = [int(x) for x in cells_str.split(",") if x.strip() != ""]
-                result["BatcelList"] = [cells]
-            except Exception:
-                _LOGGER.debug("Failed to parse BatcelList from %r", cells_str)
-
-        _LOGGER.debug("Parsed Felicity real data dict: %s", result)
+        if debug:
+            _LOGGER.debug("Parsed Felicity real data dict: %s", result)
 
         if "Batsoc" not in result and "Batt" not in result:
             raise FelicityApiError(
-                f"Unable to parse essential fields from payload: {text}"
+                f"Unable to parse essential fields from payload: {raw!r}"
             )
 
-        return result
\ No newline at end of file
+        return result
@@ -10,16 +10,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-
-# Порог "большого" разброса по ячейкам, В
-CELL_DRIFT_HIGH_THRESHOLD_V = 0.03
+from .const import CELL_DRIFT_HIGH_THRESHOLD_V, DOMAIN, EMPTY_MAP
+from .values import build_device_info
 
 
 @dataclass
@@ -96,94 +93,22 @@ class FelicityBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self.entity_description = description
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        serial = data.get("DevSN") or data.get("wifiSN") or self._entry.entry_id
-        basic = data.get("_basic") or {}
-        sw_version = basic.get("version")
-        host = self._entry.data.get(CONF_HOST)
-        serial_display = f"{serial} ({host})" if host else serial
-
-
-        return {
-            "identifiers": {(DOMAIN, serial)},
-            "name": self._entry.data.get("name", "Felicity Battery"),
-            "manufacturer": "Felicity",
-            "model": "FLA48200",
-            "sw_version": sw_version,
-            "serial_number": serial_display,
-        }
+        self._attr_device_info = build_device_info(
+            entry, coordinator.data or EMPTY_MAP
+        )
 
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        data: dict = self.coordinator.data or {}
-        key = self.entity_description.key
-
-        def get_nested(path: tuple[Any, ...]):
-            cur: Any = data
-            try:
-                for p in path:
-                    cur = cur[p]
-                return cur
-            except (KeyError, IndexError, TypeError):
-                return None
-
-        if key == "fault_active":
-            v = data.get("Bfault")
-            if v is None:
-                return None
-            return v != 0
-
-        if key == "warning_active":
-            v = data.get("Bwarn")
-            if v is None:
-                return None
-            return v != 0
-
-        estate = data.get("Estate")
-        if key == "charging":
-            # по коду состояния + по знаку тока
-            if estate == 9152:
-                return True
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is None:
-                return None
-            return (i_raw / 10.0) > 0.05
-
-        if key == "discharging":
-            if estate == 5056:
-                return True
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is None:
-                return None
-            return (i_raw / 10.0) < -0.05
-
-        if key == "standby":
-            if estate in (960, 320):
-                return True
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is None:
-                return None
-            return abs(i_raw / 10.0) <= 0.05
-
-        if key == "cell_drift_high":
-            max_raw = get_nested(("BMaxMin", 0, 0))
-            min_raw = get_nested(("BMaxMin", 0, 1))
-            if max_raw is None or min_raw is None:
-                return None
-            drift_v = (max_raw - min_raw) / 1000.0
-            return drift_v > CELL_DRIFT_HIGH_THRESHOLD_V
-
-        return None
+        data = self.coordinator.data or EMPTY_MAP
+        cached = data.get("_cached_binary") or EMPTY_MAP
+        return cached.get(self.entity_description.key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Attributes for some binary sensors."""
-        data: dict = self.coordinator.data or {}
+        data = self.coordinator.data or EMPTY_MAP
         key = self.entity_description.key
 
         if key == "cell_drift_high":
@@ -1,6 +1,10 @@
 from __future__ import annotations
 # -*- coding: utf-8 -*-
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from homeassistant.const import Platform
 
 DOMAIN = "felicity_battery"
@@ -8,6 +12,12 @@ DOMAIN = "felicity_battery"
 DEFAULT_PORT = 53970
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 
+# Общий пустой read-only словарь вместо `or {}` в горячих местах
+EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+# Порог "большого" разброса по ячейкам, В
+CELL_DRIFT_HIGH_THRESHOLD_V = 0.03
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
@@ -12,7 +12,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_HOST,
     PERCENTAGE,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
@@ -24,7 +23,8 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAP
+from .values import build_device_info
 
 
 @dataclass
@@ -507,246 +507,23 @@ class FelicitySensor(CoordinatorEntity, SensorEntity):
         self.entity_description = description
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info to group entities into one device."""
-        data = self.coordinator.data or {}
-        serial = data.get("DevSN") or data.get("wifiSN") or self._entry.entry_id
-        basic = data.get("_basic") or {}
-        sw_version = basic.get("version")
-        host = self._entry.data.get(CONF_HOST)
-        serial_display = f"{serial} ({host})" if host else serial
-
-
-        return {
-            "identifiers": {(DOMAIN, serial)},
-            "name": self._entry.data.get("name", "Felicity Battery"),
-            "manufacturer": "Felicity",
-            "model": "FLA48200",
-            "sw_version": sw_version,
-            "serial_number": serial_display,
-        }
+        self._attr_device_info = build_device_info(
+            entry, coordinator.data or EMPTY_MAP
+        )
 
 
 
     @property
     def native_value(self) -> Any:
         """Return the native value of the entity."""
-        data: dict = self.coordinator.data or {}
-        key = self.entity_description.key
-
-        def get_nested(path: tuple[Any, ...]):
-            cur: Any = data
-            try:
-                for p in path:
-                    cur = cur[p]
-                return cur
-            except (KeyError, IndexError, TypeError):
-                return None
-
-        # --- Runtime telemetry ---
-        if key == "soc":
-            raw = get_nested(("Batsoc", 0, 0))
-            return round(raw / 100, 1) if raw is not None else None
-
-        if key == "voltage":
-            raw = get_nested(("Batt", 0, 0))
-            return round(raw / 1000, 2) if raw is not None else None
-
-        if key == "current":
-            raw = get_nested(("Batt", 1, 0))
-            return round(raw / 10, 1) if raw is not None else None
-
-        if key == "power":
-            v_raw = get_nested(("Batt", 0, 0))
-            i_raw = get_nested(("Batt", 1, 0))
-            if v_raw is None or i_raw is None:
-                return None
-            v = v_raw / 1000
-            i = i_raw / 10
-            return round(v * i)
-
-        if key == "charge_current":
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is None:
-                return None
-            current = i_raw / 10.0
-            return round(current, 1) if current > 0 else 0.0
-
-        if key == "discharge_current":
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is None:
-                return None
-            current = i_raw / 10.0
-            return round(-current, 1) if current < 0 else 0.0
-
-        if key == "charge_power":
-            v_raw = get_nested(("Batt", 0, 0))
-            i_raw = get_nested(("Batt", 1, 0))
-            if v_raw is None or i_raw is None:
-                return None
-            v = v_raw / 1000.0
-            i = i_raw / 10.0
-            p = v * i
-            return round(p) if p > 0 else 0
-
-        if key == "discharge_power":
-            v_raw = get_nested(("Batt", 0, 0))
-            i_raw = get_nested(("Batt", 1, 0))
-            if v_raw is None or i_raw is None:
-                return None
-            v = v_raw / 1000.0
-            i = i_raw / 10.0
-            p = v * i
-            return round(-p) if p < 0 else 0
-
-        if key == "direction":
-            i_raw = get_nested(("Batt", 1, 0))
-            if i_raw is not None:
-                current = i_raw / 10.0
-                if current > 0.05:
-                    return "charging"
-                if current < -0.05:
-                    return "discharging"
-            code = data.get("Estate")
-            if code == 9152:
-                return "charging"
-            if code == 5056:
-                return "discharging"
-            if code in (960, 320):
-                return "idle"
-            return "idle"
-
-        if key == "temp1":
-            raw = get_nested(("BTemp", 0, 0))
-            return round(raw / 10, 1) if raw is not None else None
-
-        if key == "temp2":
-            raw = get_nested(("BTemp", 0, 1))
-            return round(raw / 10, 1) if raw is not None else None
-
-        if key == "max_cell_v":
-            raw = get_nested(("BMaxMin", 0, 0))
-            return round(raw / 1000, 3) if raw is not None else None
-
-        if key == "min_cell_v":
-            raw = get_nested(("BMaxMin", 0, 1))
-            return round(raw / 1000, 3) if raw is not None else None
-
-        if key == "cell_drift":
-            max_raw = get_nested(("BMaxMin", 0, 0))
-            min_raw = get_nested(("BMaxMin", 0, 1))
-            if max_raw is None or min_raw is None:
-                return None
-            return round((max_raw - min_raw) / 1000, 3)
-
-        # --- Cell voltages 1–16 ---
-        if key.startswith("cell_") and key.endswith("_v"):
-            try:
-                idx = int(key.split("_")[1]) - 1  # 0..15
-            except (ValueError, IndexError):
-                return None
-            raw = get_nested(("BatcelList", 0, idx))
-            if raw is None or raw == 65535:
-                return None
-            # мВ -> В, три знака
-            return round(raw / 1000.0, 3)
-
-        # --- Limits from runtime data ---
-        if key == "max_charge_current":
-            raw = get_nested(("LVolCur", 1, 0))
-            return round(raw / 10, 1) if raw is not None else None
-
-        if key == "max_discharge_current":
-            raw = get_nested(("LVolCur", 1, 1))
-            return round(raw / 10, 1) if raw is not None else None
-
-        if key == "state":
-            code = data.get("Estate")
-            if code is None:
-                return None
-            if code == 320:
-                return "full"
-            if code == 960:
-                return "standby"
-            if code == 9152:
-                return "charging"
-            if code == 5056:
-                return "discharging"
-            return f"unknown({code})"
-
-        if key == "fault":
-            v = data.get("Bfault")
-            if v is None:
-                return None
-            return int(v)
-
-        if key == "warning":
-            v = data.get("Bwarn")
-            if v is None:
-                return None
-            return int(v)
-
-        # --- Basic info / firmware / type ---
-        basic = data.get("_basic") or {}
-        settings = data.get("_settings") or {}
-
-        if key == "fw_version":
-            return basic.get("version")
-
-        if key == "bms_m1_fw":
-            return basic.get("M1SwVer")
-
-        if key == "bms_m2_fw":
-            return basic.get("M2SwVer")
-
-        if key == "battery_type":
-            return basic.get("Type")
-
-        if key == "battery_subtype":
-            return basic.get("SubType")
-
-        if key == "serial":
-            return data.get("DevSN") or data.get("wifiSN")
-
-        if key == "wifi_serial":
-            return data.get("wifiSN")
-
-        # --- Settings / thresholds ---
-        if key == "ttl_pack":
-            return settings.get("ttlPack")
-
-        if key == "cell_v_80":
-            raw = settings.get("wCVP80")
-            return round(raw / 1000, 3) if isinstance(raw, (int, float)) else None
-
-        if key == "cell_v_20":
-            raw = settings.get("wCVP20")
-            return round(raw / 1000, 3) if isinstance(raw, (int, float)) else None
-
-        if key == "cell_over_voltage":
-            raw = settings.get("cVolHi")
-            return round(raw / 1000, 3) if isinstance(raw, (int, float)) else None
-
-        if key == "cell_under_voltage":
-            raw = settings.get("cVolLo")
-            return round(raw / 1000, 3) if isinstance(raw, (int, float)) else None
-
-        if key == "charge_limit_setting":
-            raw = settings.get("bCCHi2")
-            return round(raw / 10, 1) if isinstance(raw, (int, float)) else None
-
-        if key == "discharge_limit_setting":
-            raw = settings.get("bDCHi2")
-            return round(raw / 10, 1) if isinstance(raw, (int, float)) else None
-
-        return None
+        data = self.coordinator.data or EMPTY_MAP
+        cached = data.get("_cached") or EMPTY_MAP
+        return cached.get(self.entity_description.key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra attributes for some sensors."""
-        data: dict = self.coordinator.data or {}
+        data = self.coordinator.data or EMPTY_MAP
         key = self.entity_description.key
 
         # Агрегация по ячейкам для сенсора cell_drift
@@ -0,0 +1,322 @@
+from __future__ import annotations
+# -*- coding: utf-8 -*-
+
+from collections.abc import Callable, Mapping
+import logging
+import operator
+from typing import Any
+
+from homeassistant.const import CONF_HOST
+
+from .const import CELL_DRIFT_HIGH_THRESHOLD_V, DOMAIN, EMPTY_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def build_device_info(entry: Any, data: Mapping[str, Any]) -> dict[str, Any]:
+    """Build device info to group entities into one device."""
+    # HA читает device_info только при регистрации сущности, а первый опрос
+    # всегда завершается до загрузки платформ - хватает одной сборки
+    serial = data.get("DevSN") or data.get("wifiSN") or entry.entry_id
+    basic = data.get("_basic") or EMPTY_MAP
+    host = entry.data.get(CONF_HOST)
+    serial_display = f"{serial} ({host})" if host else serial
+    return {
+        "identifiers": {(DOMAIN, serial)},
+        "name": entry.data.get("name", "Felicity Battery"),
+        "manufacturer": "Felicity",
+        "model": "FLA48200",
+        "sw_version": basic.get("version"),
+        "serial_number": serial_display,
+    }
+
+
+def _make_getter(path: tuple[Any, ...]) -> Callable[[dict[str, Any]], Any]:
+    """Build accessor for a static payload path, None if the path is missing."""
+    getters = [operator.itemgetter(p) for p in path]
+
+    def _getter(data: dict[str, Any]) -> Any:
+        cur: Any = data
+        try:
+            for get in getters:
+                cur = get(cur)
+            return cur
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    return _getter
+
+
+def _make_scaled_getter(
+    path: tuple[Any, ...], divisor: float, ndigits: int
+) -> Callable[[dict[str, Any]], float | None]:
+    """Build value_fn that reads a raw integer and scales it to units."""
+    getter = _make_getter(path)
+
+    def _value(data: dict[str, Any]) -> float | None:
+        raw = getter(data)
+        return round(raw / divisor, ndigits) if raw is not None else None
+
+    return _value
+
+
+_BATT_V = _make_getter(("Batt", 0, 0))
+_BATT_I = _make_getter(("Batt", 1, 0))
+_CELL_MAX = _make_getter(("BMaxMin", 0, 0))
+_CELL_MIN = _make_getter(("BMaxMin", 0, 1))
+
+
+def _as_int(raw: Any) -> int | None:
+    return int(raw) if raw is not None else None
+
+
+def _basic(data: dict[str, Any]) -> Mapping[str, Any]:
+    basic = data.get("_basic")
+    return basic if isinstance(basic, dict) else EMPTY_MAP
+
+
+def _settings(data: dict[str, Any]) -> Mapping[str, Any]:
+    settings = data.get("_settings")
+    return settings if isinstance(settings, dict) else EMPTY_MAP
+
+
+def _power_raw(data: dict[str, Any]) -> float | None:
+    v_raw = _BATT_V(data)
+    i_raw = _BATT_I(data)
+    if v_raw is None or i_raw is None:
+        return None
+    return (v_raw / 1000.0) * (i_raw / 10.0)
+
+
+def _power(data: dict[str, Any]) -> int | None:
+    p = _power_raw(data)
+    return round(p) if p is not None else None
+
+
+def _charge_current(data: dict[str, Any]) -> float | None:
+    i_raw = _BATT_I(data)
+    if i_raw is None:
+        return None
+    current = i_raw / 10.0
+    return round(current, 1) if current > 0 else 0.0
+
+
+def _discharge_current(data: dict[str, Any]) -> float | None:
+    i_raw = _BATT_I(data)
+    if i_raw is None:
+        return None
+    current = i_raw / 10.0
+    return round(-current, 1) if current < 0 else 0.0
+
+
+def _charge_power(data: dict[str, Any]) -> int | None:
+    p = _power_raw(data)
+    if p is None:
+        return None
+    return round(p) if p > 0 else 0
+
+
+def _discharge_power(data: dict[str, Any]) -> int | None:
+    p = _power_raw(data)
+    if p is None:
+        return None
+    return round(-p) if p < 0 else 0
+
+
+def _direction(data: dict[str, Any]) -> str:
+    i_raw = _BATT_I(data)
+    if i_raw is not None:
+        current = i_raw / 10.0
+        if current > 0.05:
+            return "charging"
+        if current < -0.05:
+            return "discharging"
+    code = data.get("Estate")
+    if code == 9152:
+        return "charging"
+    if code == 5056:
+        return "discharging"
+    return "idle"
+
+
+def _cell_drift(data: dict[str, Any]) -> float | None:
+    max_raw = _CELL_MAX(data)
+    min_raw = _CELL_MIN(data)
+    if max_raw is None or min_raw is None:
+        return None
+    return round((max_raw - min_raw) / 1000, 3)
+
+
+def _state(data: dict[str, Any]) -> str | None:
+    code = data.get("Estate")
+    if code is None:
+        return None
+    if code == 320:
+        return "full"
+    if code == 960:
+        return "standby"
+    if code == 9152:
+        return "charging"
+    if code == 5056:
+        return "discharging"
+    return f"unknown({code})"
+
+
+def _cell_voltage(idx: int) -> Callable[[dict[str, Any]], float | None]:
+    """Build value_fn for cell idx (0..15), mV -> V."""
+    getter = _make_getter(("BatcelList", 0, idx))
+
+    def _value(data: dict[str, Any]) -> float | None:
+        raw = getter(data)
+        if raw is None or raw == 65535:
+            return None
+        return round(raw / 1000.0, 3)
+
+    return _value
+
+
+def _setting_value(
+    key: str, divisor: float, ndigits: int
+) -> Callable[[dict[str, Any]], float | None]:
+    """Build value_fn for a numeric threshold from 'dev set infor'."""
+
+    def _value(data: dict[str, Any]) -> float | None:
+        raw = _settings(data).get(key)
+        if not isinstance(raw, (int, float)):
+            return None
+        return round(raw / divisor, ndigits)
+
+    return _value
+
+
+# --------------------------------------------------------------------- #
+#                            Binary sensors                             #
+# --------------------------------------------------------------------- #
+
+
+def _nonzero(key: str) -> Callable[[dict[str, Any]], bool | None]:
+    """Build value_fn for a fault/warning code: on if non-zero."""
+
+    def _value(data: dict[str, Any]) -> bool | None:
+        v = data.get(key)
+        if v is None:
+            return None
+        return v != 0
+
+    return _value
+
+
+def _is_charging(data: dict[str, Any]) -> bool | None:
+    # по коду состояния + по знаку тока
+    if data.get("Estate") == 9152:
+        return True
+    i_raw = _BATT_I(data)
+    if i_raw is None:
+        return None
+    return (i_raw / 10.0) > 0.05
+
+
+def _is_discharging(data: dict[str, Any]) -> bool | None:
+    if data.get("Estate") == 5056:
+        return True
+    i_raw = _BATT_I(data)
+    if i_raw is None:
+        return None
+    return (i_raw / 10.0) < -0.05
+
+
+def _is_standby(data: dict[str, Any]) -> bool | None:
+    if data.get("Estate") in (960, 320):
+        return True
+    i_raw = _BATT_I(data)
+    if i_raw is None:
+        return None
+    return abs(i_raw / 10.0) <= 0.05
+
+
+def _is_cell_drift_high(data: dict[str, Any]) -> bool | None:
+    max_raw = _CELL_MAX(data)
+    min_raw = _CELL_MIN(data)
+    if max_raw is None or min_raw is None:
+        return None
+    return (max_raw - min_raw) / 1000.0 > CELL_DRIFT_HIGH_THRESHOLD_V
+
+
+ValueFn = Callable[[dict[str, Any]], Any]
+
+SENSOR_VALUE_FNS: dict[str, ValueFn] = {
+    "soc": _make_scaled_getter(("Batsoc", 0, 0), 100, 1),
+    "voltage": _make_scaled_getter(("Batt", 0, 0), 1000, 2),
+    "current": _make_scaled_getter(("Batt", 1, 0), 10, 1),
+    "power": _power,
+    "charge_current": _charge_current,
+    "discharge_current": _discharge_current,
+    "charge_power": _charge_power,
+    "discharge_power": _discharge_power,
+    "direction": _direction,
+    "temp1": _make_scaled_getter(("BTemp", 0, 0), 10, 1),
+    "temp2": _make_scaled_getter(("BTemp", 0, 1), 10, 1),
+    "max_cell_v": _make_scaled_getter(("BMaxMin", 0, 0), 1000, 3),
+    "min_cell_v": _make_scaled_getter(("BMaxMin", 0, 1), 1000, 3),
+    "cell_drift": _cell_drift,
+    "cell_1_v": _cell_voltage(0),
+    "cell_2_v": _cell_voltage(1),
+    "cell_3_v": _cell_voltage(2),
+    "cell_4_v": _cell_voltage(3),
+    "cell_5_v": _cell_voltage(4),
+    "cell_6_v": _cell_voltage(5),
+    "cell_7_v": _cell_voltage(6),
+    "cell_8_v": _cell_voltage(7),
+    "cell_9_v": _cell_voltage(8),
+    "cell_10_v": _cell_voltage(9),
+    "cell_11_v": _cell_voltage(10),
+    "cell_12_v": _cell_voltage(11),
+    "cell_13_v": _cell_voltage(12),
+    "cell_14_v": _cell_voltage(13),
+    "cell_15_v": _cell_voltage(14),
+    "cell_16_v": _cell_voltage(15),
+    "max_charge_current": _make_scaled_getter(("LVolCur", 1, 0), 10, 1),
+    "max_discharge_current": _make_scaled_getter(("LVolCur", 1, 1), 10, 1),
+    "state": _state,
+    "fault": lambda d: _as_int(d.get("Bfault")),
+    "warning": lambda d: _as_int(d.get("Bwarn")),
+    "fw_version": lambda d: _basic(d).get("version"),
+    "bms_m1_fw": lambda d: _basic(d).get("M1SwVer"),
+    "bms_m2_fw": lambda d: _basic(d).get("M2SwVer"),
+    "battery_type": lambda d: _basic(d).get("Type"),
+    "battery_subtype": lambda d: _basic(d).get("SubType"),
+    "serial": lambda d: d.get("DevSN") or d.get("wifiSN"),
+    "wifi_serial": lambda d: d.get("wifiSN"),
+    "ttl_pack": lambda d: _settings(d).get("ttlPack"),
+    "cell_v_80": _setting_value("wCVP80", 1000, 3),
+    "cell_v_20": _setting_value("wCVP20", 1000, 3),
+    "cell_over_voltage": _setting_value("cVolHi", 1000, 3),
+    "cell_under_voltage": _setting_value("cVolLo", 1000, 3),
+    "charge_limit_setting": _setting_value("bCCHi2", 10, 1),
+    "discharge_limit_setting": _setting_value("bDCHi2", 10, 1),
+}
+
+BINARY_SENSOR_VALUE_FNS: dict[str, ValueFn] = {
+    "fault_active": _nonzero("Bfault"),
+    "warning_active": _nonzero("Bwarn"),
+    "charging": _is_charging,
+    "discharging": _is_discharging,
+    "standby": _is_standby,
+    "cell_drift_high": _is_cell_drift_high,
+}
+
+
+def compute_values(
+    data: dict[str, Any], value_fns: Mapping[str, ValueFn]
+) -> dict[str, Any]:
+    """Evaluate every entity value once per coordinator update."""
+    values: dict[str, Any] = {}
+    for key, value_fn in value_fns.items():
+        try:
+            values[key] = value_fn(data)
+        except (TypeError, ValueError, ArithmeticError) as err:
+            # отсутствующие пути value_fn отдаёт как None; сюда попадает
+            # только битое значение (строка вместо числа, inf из 1e400)
+            _LOGGER.debug("Failed to compute %s: %s", key, err)
+            values[key] = None
+    return values